@@ -1,20 +1,20 @@
 import asyncio
-import json
+import audioop
 import logging
 import os
+import re
+import struct
 import time
 import uuid
-import wave
-import io
-import base64
+from binascii import a2b_base64, b2a_base64
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import AsyncIterator, Optional
 from collections import defaultdict
 
 import httpx
 import numpy as np
-from scipy import signal
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -48,96 +48,98 @@ TWILIO_DOMAIN = os.getenv("TWILIO_DOMAIN", "localhost:8000")
 
 twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN) if TWILIO_ACCOUNT_SID else None
 
+_SILENCE_THRESHOLD = 500
+
+def _build_ulaw_decode_table() -> np.ndarray:
+    return np.frombuffer(audioop.ulaw2lin(bytes(range(256)), 2), dtype=np.int16)
+
+def _build_ulaw_encode_table() -> np.ndarray:
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16)
+    pcm = np.where(np.abs(pcm.astype(np.int32)) < _SILENCE_THRESHOLD, 0, pcm)
+    return np.frombuffer(
+        audioop.lin2ulaw(pcm.astype(np.int16).tobytes(), 2), dtype=np.uint8
+    )
+
+_ULAW_DECODE = _build_ulaw_decode_table()
+_ULAW_ENCODE = _build_ulaw_encode_table()
+
+def _byte_view(array: np.ndarray) -> memoryview:
+    return memoryview(array).cast("B")
+
 class AudioConverter:
+    # Passing a preallocated `out` array writes the result into its head and
+    # returns a memoryview over that slice instead of a fresh bytes copy.
+
     @staticmethod
-    def ulaw_to_pcm(ulaw_audio: bytes) -> bytes:
+    def ulaw_to_pcm(
+        ulaw_audio: bytes, out: Optional[np.ndarray] = None
+    ) -> bytes | memoryview:
         ulaw_array = np.frombuffer(ulaw_audio, dtype=np.uint8)
-        
-        bias = 0x84
-        mask = 0x84
-        
-        pcm_array = np.empty(len(ulaw_array), dtype=np.int16)
-        
-        for i, sample in enumerate(ulaw_array):
-            sample = ~sample
-            sign = (sample & 0x80) >> 7
-            exponent = (sample & 0x70) >> 4
-            mantissa = sample & 0x0F
-            
-            mantissa = (mantissa << 3) + 0x84
-            
-            if exponent > 0:
-                mantissa = mantissa << exponent
-            
-            if sign == 0:
-                pcm_array[i] = mantissa
-            else:
-                pcm_array[i] = -mantissa
-        
-        return pcm_array.astype(np.int16).tobytes()
+        if out is None:
+            return _ULAW_DECODE[ulaw_array].tobytes()
+        out = out[: len(ulaw_array)]
+        np.take(_ULAW_DECODE, ulaw_array, out=out, mode="clip")
+        return _byte_view(out)
 
     @staticmethod
-    def pcm_to_ulaw(pcm_audio: bytes) -> bytes:
-        pcm_array = np.frombuffer(pcm_audio, dtype=np.int16)
-        
-        silence_threshold = 500
-        pcm_array = np.where(
-            np.abs(pcm_array) < silence_threshold,
-            0,
-            pcm_array
-        )
-        
-        mask = 0x84
-        ulaw_array = np.empty(len(pcm_array), dtype=np.uint8)
-        
-        for i, sample in enumerate(pcm_array):
-            sign = 0 if sample >= 0 else 0x80
-            sample = abs(sample)
-            
-            exponent = 0
-            if sample > 0x1FFF:
-                sample = sample >> 3
-            
-            if sample > 0xFF:
-                exponent = 1
-                while sample > 0x1FFF and exponent < 7:
-                    sample = sample >> 1
-                    exponent += 1
-            
-            mantissa = (sample >> (exponent + 3)) & 0x0F
-            
-            byte = ~(sign | (exponent << 4) | mantissa)
-            ulaw_array[i] = byte & 0xFF
-        
-        return ulaw_array.astype(np.uint8).tobytes()
+    def pcm_to_ulaw(
+        pcm_audio: bytes, out: Optional[np.ndarray] = None
+    ) -> bytes | memoryview:
+        pcm_array = np.frombuffer(pcm_audio, dtype=np.uint16)
+        if out is None:
+            return _ULAW_ENCODE[pcm_array].tobytes()
+        out = out[: len(pcm_array)]
+        np.take(_ULAW_ENCODE, pcm_array, out=out, mode="clip")
+        return _byte_view(out)
 
     @staticmethod
-    def resample_8k_to_16k(audio_8k: bytes) -> bytes:
+    def resample_8k_to_16k(
+        audio_8k: bytes, out: Optional[np.ndarray] = None
+    ) -> bytes | memoryview:
         audio_8k_array = np.frombuffer(audio_8k, dtype=np.int16)
         
-        num_samples = len(audio_8k_array)
-        new_num_samples = num_samples * 2
-        
-        audio_16k_array = np.zeros(new_num_samples, dtype=np.int16)
-        
-        for i in range(len(audio_8k_array) - 1):
-            audio_16k_array[i * 2] = audio_8k_array[i]
-            audio_16k_array[i * 2 + 1] = (
-                int(audio_8k_array[i]) + int(audio_8k_array[i + 1])
-            ) // 2
+        if out is None:
+            audio_16k_array = np.empty(len(audio_8k_array) * 2, dtype=np.int16)
+        else:
+            audio_16k_array = out[: len(audio_8k_array) * 2]
         
         if len(audio_8k_array) > 0:
+            audio_16k_array[0::2] = audio_8k_array
+            audio_16k_array[1:-1:2] = (
+                audio_8k_array[:-1].astype(np.int32) + audio_8k_array[1:]
+            ) >> 1
             audio_16k_array[-1] = audio_8k_array[-1]
         
-        return audio_16k_array.astype(np.int16).tobytes()
+        if out is None:
+            return audio_16k_array.tobytes()
+        return _byte_view(audio_16k_array)
 
     @staticmethod
-    def resample_16k_to_8k(audio_16k: bytes) -> bytes:
+    def resample_16k_to_8k(
+        audio_16k: bytes, out: Optional[np.ndarray] = None
+    ) -> bytes | memoryview:
         audio_16k_array = np.frombuffer(audio_16k, dtype=np.int16)
         
         audio_8k_array = audio_16k_array[::2]
         
-        return audio_8k_array.astype(np.int16).tobytes()
+        if out is None:
+            return audio_8k_array.tobytes()
+        out = out[: len(audio_8k_array)]
+        np.copyto(out, audio_8k_array)
+        return _byte_view(out)
+
+    @staticmethod
+    def pcm16k_to_ulaw8k(
+        audio_16k: bytes, out: Optional[np.ndarray] = None
+    ) -> bytes | memoryview:
+        # Decimate through a strided view straight into the encode table,
+        # without materializing the 8 kHz PCM in between.
+        decimated = np.frombuffer(audio_16k, dtype=np.uint16)[::2]
+        if out is None:
+            return _ULAW_ENCODE[decimated].tobytes()
+        out = out[: len(decimated)]
+        np.take(_ULAW_ENCODE, decimated, out=out, mode="clip")
+        return _byte_view(out)
 
 class BotType(str, Enum):
     QUICKRUPEE = "quickrupee"
@@ -162,7 +164,8 @@ class ConnectionManager:
     def __init__(self):
         self.active_connections: dict[str, WebSocket] = {}
         self.sessions: dict[str, SessionData] = {}
-        self.audio_buffers: dict[str, bytearray] = defaultdict(bytearray)
+        self.audio_buffers: dict[str, list[bytes]] = defaultdict(list)
+        self.audio_buffer_sizes: dict[str, int] = defaultdict(int)
 
     async def connect(self, websocket: WebSocket, session_id: str):
         await websocket.accept()
@@ -175,10 +178,25 @@ class ConnectionManager:
             del self.sessions[session_id]
         if session_id in self.audio_buffers:
             del self.audio_buffers[session_id]
+        if session_id in self.audio_buffer_sizes:
+            del self.audio_buffer_sizes[session_id]
+
+    def append_audio(self, session_id: str, audio_chunk: bytes):
+        self.audio_buffers[session_id].append(audio_chunk)
+        self.audio_buffer_sizes[session_id] += len(audio_chunk)
+
+    def get_audio(self, session_id: str) -> bytes:
+        return b"".join(self.audio_buffers[session_id])
+
+    def clear_audio(self, session_id: str):
+        self.audio_buffers[session_id].clear()
+        self.audio_buffer_sizes[session_id] = 0
 
     async def send_message(self, session_id: str, data: dict):
         if session_id in self.active_connections:
-            await self.active_connections[session_id].send_json(data)
+            await self.active_connections[session_id].send_text(
+                orjson.dumps(data).decode()
+            )
 
     async def send_audio_chunk(self, session_id: str, audio_chunk: bytes, chunk_type: str):
         if session_id in self.active_connections:
@@ -188,6 +206,12 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+_YES_WORDS = frozenset(["yes", "yep", "yeah", "true", "sure", "okay", "ok", "correct"])
+_NO_WORDS = frozenset(["no", "nope", "nah", "false", "negative"])
+_YES_NO_RE = re.compile(
+    r"\b(" + "|".join(sorted(_YES_WORDS | _NO_WORDS, key=len, reverse=True)) + r")\b"
+)
+
 class BotLogic:
     QUICKRUPEE_QUESTIONS = [
         {
@@ -231,6 +255,17 @@ class BotLogic:
         },
     ]
 
+    _QUESTION_MAP = {
+        (bot_type, q["state"]): q
+        for bot_type, questions in (
+            (BotType.QUICKRUPEE, QUICKRUPEE_QUESTIONS),
+            (BotType.HOME_RENOVATION, HOME_RENOVATION_QUESTIONS),
+        )
+        for q in questions
+    }
+
+    FALLBACK_TEXT = "I didn't quite understand. Could you please say yes or no?"
+
     @staticmethod
     def get_greeting(bot_type: BotType) -> str:
         if bot_type == BotType.QUICKRUPEE:
@@ -240,29 +275,23 @@ class BotLogic:
 
     @staticmethod
     def get_next_question(bot_type: BotType, state: BotState) -> Optional[dict]:
-        questions = (
-            BotLogic.QUICKRUPEE_QUESTIONS
-            if bot_type == BotType.QUICKRUPEE
-            else BotLogic.HOME_RENOVATION_QUESTIONS
-        )
-        for q in questions:
-            if q["state"] == state:
-                return q
-        return None
+        return BotLogic._QUESTION_MAP.get((bot_type, state))
+
+    @staticmethod
+    def get_expected_question(bot_type: BotType, state: BotState) -> Optional[dict]:
+        if state == BotState.GREETING:
+            return BotLogic.get_next_question(bot_type, BotState.Q1)
+        question = BotLogic.get_next_question(bot_type, state)
+        if question is None:
+            return None
+        return BotLogic.get_next_question(bot_type, question["next_state"])
 
     @staticmethod
     def parse_yes_no(text: str) -> Optional[bool]:
-        text_lower = text.lower().strip()
-        yes_words = ["yes", "yep", "yeah", "true", "sure", "okay", "ok", "correct"]
-        no_words = ["no", "nope", "nah", "false", "negative"]
-        
-        for word in yes_words:
-            if word in text_lower:
-                return True
-        for word in no_words:
-            if word in text_lower:
-                return False
-        return None
+        match = _YES_NO_RE.search(text.lower())
+        if match is None:
+            return None
+        return match.group(1) in _YES_WORDS
 
     @staticmethod
     def evaluate_eligibility(bot_type: BotType, answers: dict) -> tuple[bool, str]:
@@ -279,30 +308,67 @@ class BotLogic:
             else:
                 return False, "Thank you for reaching out. We appreciate your interest in our services."
 
+    @staticmethod
+    def get_static_prompts() -> list[str]:
+        prompts = [BotLogic.FALLBACK_TEXT]
+        for bot_type in BotType:
+            prompts.append(BotLogic.get_greeting(bot_type))
+            prompts.extend(
+                q["text"]
+                for q in (
+                    BotLogic.QUICKRUPEE_QUESTIONS
+                    if bot_type == BotType.QUICKRUPEE
+                    else BotLogic.HOME_RENOVATION_QUESTIONS
+                )
+            )
+            for answer in (True, False):
+                _, result_text = BotLogic.evaluate_eligibility(
+                    bot_type, {"q1": answer, "q2": answer, "q3": answer}
+                )
+                prompts.append(result_text)
+        return prompts
+
+_http: Optional[httpx.AsyncClient] = None
+
+@app.on_event("startup")
+async def open_http_client():
+    global _http
+    _http = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+
+@app.on_event("shutdown")
+async def close_http_client():
+    if _http is not None:
+        await _http.aclose()
+
+def _wav_header(num_samples: int) -> bytes:
+    data_size = num_samples * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, 16000, 32000, 2, 16,
+        b"data", data_size,
+    )
+
 async def transcribe_audio(audio_bytes: bytes) -> tuple[str, float]:
     start = time.time()
     
-    wav_io = io.BytesIO()
-    with wave.open(wav_io, "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(16000)
-        wav_file.writeframes(audio_bytes)
+    wav_bytes = _wav_header(len(audio_bytes) // 2) + audio_bytes
     
-    wav_io.seek(0)
+    files = {"file": ("audio.wav", wav_bytes, "audio/wav")}
+    data = {"model": "whisper-1"}
+    headers = {"Authorization": f"Bearer {OPENAI_API_KEY}"}
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        files = {"file": ("audio.wav", wav_io, "audio/wav")}
-        data = {"model": "whisper-1"}
-        headers = {"Authorization": f"Bearer {OPENAI_API_KEY}"}
-        
-        response = await client.post(
-            "https://api.openai.com/v1/audio/transcriptions",
-            files=files,
-            data=data,
-            headers=headers,
-        )
-        response.raise_for_status()
+    response = await _http.post(
+        "https://api.openai.com/v1/audio/transcriptions",
+        files=files,
+        data=data,
+        headers=headers,
+    )
+    response.raise_for_status()
     
     result = response.json()
     latency = time.time() - start
@@ -312,25 +378,106 @@ async def transcribe_audio(audio_bytes: bytes) -> tuple[str, float]:
 async def synthesize_speech(text: str) -> tuple[bytes, float]:
     start = time.time()
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            f"https://api.elevenlabs.io/v1/text-to-speech/{VOICE_ID}",
-            headers={
-                "xi-api-key": ELEVENLABS_API_KEY,
-                "Content-Type": "application/json",
-            },
-            json={
-                "text": text,
-                "model_id": "eleven_multilingual_v2",
-                "output_format": "pcm_16000"
-            },
-        )
-        response.raise_for_status()
+    response = await _http.post(
+        f"https://api.elevenlabs.io/v1/text-to-speech/{VOICE_ID}",
+        headers={
+            "xi-api-key": ELEVENLABS_API_KEY,
+            "Content-Type": "application/json",
+        },
+        json={
+            "text": text,
+            "model_id": "eleven_multilingual_v2",
+            "output_format": "pcm_16000"
+        },
+    )
+    response.raise_for_status()
 
     audio_bytes = response.content
     latency = time.time() - start
     return audio_bytes, latency
 
+TWILIO_FRAME_SIZE = 320
+
+async def synthesize_speech_stream(text: str) -> AsyncIterator[bytes]:
+    async with _http.stream(
+        "POST",
+        f"https://api.elevenlabs.io/v1/text-to-speech/{VOICE_ID}/stream",
+        params={"output_format": "ulaw_8000"},
+        headers={
+            "xi-api-key": ELEVENLABS_API_KEY,
+            "Content-Type": "application/json",
+        },
+        json={
+            "text": text,
+            "model_id": "eleven_multilingual_v2",
+        },
+    ) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(chunk_size=TWILIO_FRAME_SIZE):
+            yield chunk
+
+_TTS_CACHE: dict[str, bytes] = {}
+_ULAW_CACHE: dict[str, bytes] = {}
+
+async def get_speech(text: str) -> tuple[bytes, float]:
+    start = time.time()
+
+    audio_bytes = _TTS_CACHE.get(text)
+    if audio_bytes is None:
+        audio_bytes, _ = await synthesize_speech(text)
+        _TTS_CACHE[text] = audio_bytes
+
+    latency = time.time() - start
+    return audio_bytes, latency
+
+class SpeechPrefetch:
+    def __init__(self, text: Optional[str]):
+        self.text = text
+        self.task: Optional[asyncio.Task] = None
+        if text is not None and text not in _TTS_CACHE:
+            self.task = asyncio.create_task(get_speech(text))
+            self.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def get(self, text: str) -> tuple[bytes, float]:
+        if self.task is not None and text == self.text:
+            return await self.task
+        self.cancel()
+        return await get_speech(text)
+
+    def cancel(self):
+        if self.task is not None:
+            self.task.cancel()
+
+async def stream_twilio_speech(text: str) -> AsyncIterator[bytes]:
+    ulaw_audio = _ULAW_CACHE.get(text)
+    if ulaw_audio is not None:
+        for i in range(0, len(ulaw_audio), TWILIO_FRAME_SIZE):
+            yield ulaw_audio[i : i + TWILIO_FRAME_SIZE]
+        return
+
+    frames = []
+    async for frame in synthesize_speech_stream(text):
+        frames.append(frame)
+        yield frame
+    _ULAW_CACHE[text] = b"".join(frames)
+
+async def get_twilio_speech(text: str) -> bytes:
+    return b"".join([frame async for frame in stream_twilio_speech(text)])
+
+@app.on_event("startup")
+async def warm_tts_cache():
+    prompts = BotLogic.get_static_prompts()
+    results = await asyncio.gather(
+        *(get_speech(text) for text in prompts),
+        *(get_twilio_speech(text) for text in prompts),
+        return_exceptions=True,
+    )
+    failed = sum(isinstance(r, Exception) for r in results)
+    if failed:
+        logger.warning(f"TTS warm-up failed for {failed}/{len(results)} requests")
+    else:
+        logger.info(f"TTS cache warmed with {len(prompts)} prompts")
+
 
 @app.post("/voice")
 async def voice_webhook():
@@ -347,11 +494,76 @@ async def voice_webhook():
     
     return Response(content=str(response), media_type="application/xml")
 
+TWILIO_FRAMES_PER_MESSAGE = 5
+TWILIO_SAMPLE_RATE = 8000
+TWILIO_PLAYBACK_LEAD = 0.2
+
+def twilio_media_prefix(stream_sid: str) -> str:
+    return '{"event":"media","streamSid":' + orjson.dumps(stream_sid).decode() + ',"media":{"payload":"'
+
+def twilio_media_message(message_prefix: str, ulaw_audio: bytes) -> str:
+    # base64 output is [A-Za-z0-9+/=] only, so it needs no JSON escaping
+    payload = b2a_base64(ulaw_audio, newline=False).decode("ascii")
+    return message_prefix + payload + '"}}'
+
+class TwilioAudioSender:
+    def __init__(self, websocket: WebSocket, stream_sid: str):
+        self.websocket = websocket
+        self.message_prefix = twilio_media_prefix(stream_sid)
+        self.texts: asyncio.Queue[str] = asyncio.Queue()
+        self.messages: asyncio.Queue[tuple[str, float]] = asyncio.Queue()
+        self.tasks = [
+            asyncio.create_task(self._produce()),
+            asyncio.create_task(self._pace()),
+        ]
+
+    def speak(self, text: str):
+        self.texts.put_nowait(text)
+
+    async def close(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def _produce(self):
+        while True:
+            text = await self.texts.get()
+            try:
+                batch = []
+                async for frame in stream_twilio_speech(text):
+                    batch.append(frame)
+                    if len(batch) == TWILIO_FRAMES_PER_MESSAGE:
+                        self._enqueue(b"".join(batch))
+                        batch.clear()
+                if batch:
+                    self._enqueue(b"".join(batch))
+            except Exception as e:
+                logger.error(f"Twilio TTS error: {e}")
+
+    def _enqueue(self, ulaw_audio: bytes):
+        self.messages.put_nowait((
+            twilio_media_message(self.message_prefix, ulaw_audio),
+            len(ulaw_audio) / TWILIO_SAMPLE_RATE,
+        ))
+
+    async def _pace(self):
+        play_until = time.monotonic()
+        while True:
+            message, duration = await self.messages.get()
+
+            now = time.monotonic()
+            if play_until - now > TWILIO_PLAYBACK_LEAD:
+                await asyncio.sleep(play_until - now - TWILIO_PLAYBACK_LEAD)
+            play_until = max(play_until, now) + duration
+
+            await self.websocket.send_text(message)
+
 @app.websocket("/ws/twilio/{session_id}")
 async def twilio_media_stream(websocket: WebSocket, session_id: str):
     await websocket.accept()
 
     stream_sid = None
+    sender = None
 
     session = SessionData(
         session_id=session_id,
@@ -363,7 +575,7 @@ async def twilio_media_stream(websocket: WebSocket, session_id: str):
 
     try:
         while True:
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
 
             # 🔥 Wait for START event first
             if data.get("event") == "start":
@@ -371,24 +583,8 @@ async def twilio_media_stream(websocket: WebSocket, session_id: str):
                 logger.info(f"Stream SID: {stream_sid}")
 
                 # 👉 Now send greeting AFTER streamSid received
-                greeting = BotLogic.get_greeting(session.bot_type)
-                audio_bytes, _ = await synthesize_speech(greeting)
-
-                pcm_8k = AudioConverter.resample_16k_to_8k(audio_bytes)
-                ulaw_audio = AudioConverter.pcm_to_ulaw(pcm_8k)
-
-                chunk_size = 320
-                for i in range(0, len(ulaw_audio), chunk_size):
-                    chunk = ulaw_audio[i:i+chunk_size]
-                    base64_chunk = base64.b64encode(chunk).decode("utf-8")
-
-                    await websocket.send_json({
-                        "event": "media",
-                        "streamSid": stream_sid,
-                        "media": {
-                            "payload": base64_chunk
-                        }
-                    })
+                sender = TwilioAudioSender(websocket, stream_sid)
+                sender.speak(BotLogic.get_greeting(session.bot_type))
 
                 session.state = BotState.GREETING
                 continue
@@ -396,8 +592,8 @@ async def twilio_media_stream(websocket: WebSocket, session_id: str):
             # 🔥 Handle incoming user voice
             if data.get("event") == "media":
                 payload = data["media"]["payload"]
-                audio_chunk = base64.b64decode(payload)
-                manager.audio_buffers[session_id].extend(audio_chunk)
+                audio_chunk = a2b_base64(payload)
+                manager.append_audio(session_id, audio_chunk)
 
             if data.get("event") == "stop":
                 break
@@ -406,6 +602,9 @@ async def twilio_media_stream(websocket: WebSocket, session_id: str):
         logger.error(f"Twilio error: {e}")
 
     finally:
+        if sender is not None:
+            await sender.close()
+        manager.disconnect(session_id)
         logger.info("Call ended")
 
 
@@ -423,7 +622,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     
     try:
         greeting = BotLogic.get_greeting(session.bot_type)
-        audio_bytes, tts_latency = await synthesize_speech(greeting)
+        audio_bytes, tts_latency = await get_speech(greeting)
         
         await manager.send_message(
             session_id,
@@ -447,13 +646,16 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             data = await websocket.receive_bytes()
             
             if data == b"END_AUDIO":
-                audio_buffer = manager.audio_buffers[session_id]
-                if len(audio_buffer) > 0:
+                if manager.audio_buffer_sizes[session_id] > 0:
+                    expected = BotLogic.get_expected_question(
+                        session.bot_type, session.state
+                    )
+                    prefetch = SpeechPrefetch(expected["text"] if expected else None)
                     try:
                         transcription, asr_latency = await transcribe_audio(
-                            bytes(audio_buffer)
+                            manager.get_audio(session_id)
                         )
-                        manager.audio_buffers[session_id].clear()
+                        manager.clear_audio(session_id)
                         
                         await manager.send_message(
                             session_id,
@@ -470,7 +672,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                                 session.bot_type, session.state
                             )
                             if question:
-                                audio_bytes, tts_latency = await synthesize_speech(
+                                audio_bytes, tts_latency = await prefetch.get(
                                     question["text"]
                                 )
                                 
@@ -494,8 +696,8 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                         answer = BotLogic.parse_yes_no(transcription)
                         
                         if answer is None:
-                            response_text = "I didn't quite understand. Could you please say yes or no?"
-                            audio_bytes, tts_latency = await synthesize_speech(
+                            response_text = BotLogic.FALLBACK_TEXT
+                            audio_bytes, tts_latency = await prefetch.get(
                                 response_text
                             )
                             
@@ -521,7 +723,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                                 is_eligible, result_text = BotLogic.evaluate_eligibility(
                                     session.bot_type, session.answers
                                 )
-                                audio_bytes, tts_latency = await synthesize_speech(
+                                audio_bytes, tts_latency = await prefetch.get(
                                     result_text
                                 )
                                 
@@ -554,7 +756,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                                     session.bot_type, session.state
                                 )
                                 if question:
-                                    audio_bytes, tts_latency = await synthesize_speech(
+                                    audio_bytes, tts_latency = await prefetch.get(
                                         question["text"]
                                     )
                                     
@@ -579,8 +781,10 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                             session_id,
                             {"type": "error", "message": str(e)},
                         )
+                    finally:
+                        prefetch.cancel()
             else:
-                manager.audio_buffers[session_id].extend(data)
+                manager.append_audio(session_id, data)
 
     except WebSocketDisconnect:
         manager.disconnect(session_id)
@@ -600,4 +804,11 @@ async def init_session(bot_type: str = "quickrupee"):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8080))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+    )